@@ -44,7 +44,7 @@ else
         echo ""
         echo "Option 2: Install pipx and use it:"
         echo "  sudo apt install pipx"
-        echo "  pipx install requests"
+        echo "  pipx install httpx"
         echo ""
         exit 1
     fi
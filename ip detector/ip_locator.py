@@ -6,28 +6,102 @@ Supports multiple providers and output formats.
 """
 
 import argparse
+import asyncio
+import functools
+import httpx
+import importlib.util
 import json
-import requests
+import os
+import socket
+import struct
 import sys
 import ipaddress
+import threading
 import time
-from typing import Dict, Optional, Any
-from dataclasses import dataclass
+from types import SimpleNamespace
+from typing import Callable, Dict, List, Optional, Any, Tuple, Union
+from dataclasses import asdict, dataclass
 from abc import ABC, abstractmethod
 
-# Color codes for terminal output
-class Colors:
-    RED = '\033[91m'
-    GREEN = '\033[92m'
-    YELLOW = '\033[93m'
-    BLUE = '\033[94m'
-    MAGENTA = '\033[95m'
-    CYAN = '\033[96m'
-    WHITE = '\033[97m'
-    BOLD = '\033[1m'
-    END = '\033[0m'
-
-@dataclass
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    from diskcache import Cache
+except ImportError:
+    Cache = None
+
+def json_loads(raw: bytes) -> Any:
+    """Decode a JSON payload, using orjson when it is available"""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+def json_dumps(obj: Any) -> str:
+    """Encode an object as indented JSON, using orjson when it is available"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+    return json.dumps(obj, indent=2)
+
+# Maximum number of IPs the provider batch endpoints accept per request
+BATCH_SIZE = 100
+
+# Below this many IPs the one-off NumPy import (~50 ms) costs more than vectorizing saves
+BULK_CLASSIFY_THRESHOLD = 50000
+
+# Requests kept in flight at once when a provider declares no rate limit
+MAX_CONCURRENCY = 32
+
+# Services that echo back the caller's public IP as plain text
+PUBLIC_IP_SERVICES = [
+    "https://api.ipify.org?format=text",
+    "https://ipinfo.io/ip",
+    "https://icanhazip.com",
+    "https://ident.me"
+]
+
+# On-disk cache of lookup results, geolocation data changes slowly
+CACHE_DIR = os.path.expanduser("~/.ip_locator_cache")
+CACHE_TTL = 24 * 60 * 60  # seconds
+
+# HTTP/2 multiplexing needs the optional h2 package (httpx[http2])
+_HTTP2 = importlib.util.find_spec("h2") is not None
+_LIMITS = httpx.Limits(max_connections=MAX_CONCURRENCY, max_keepalive_connections=MAX_CONCURRENCY)
+
+# Shared client so repeated requests to the same host reuse pooled connections
+@functools.lru_cache(maxsize=1)
+def _get_client() -> httpx.Client:
+    """Create the shared client on first use, runs without network lookups skip its SSL setup"""
+    return httpx.Client(
+        transport=httpx.HTTPTransport(http2=_HTTP2, limits=_LIMITS, retries=3),
+        timeout=10,
+        follow_redirects=True
+    )
+
+def _async_client(timeout: float = 10) -> httpx.AsyncClient:
+    """Create an async client with the same HTTP/2 and pooling settings"""
+    return httpx.AsyncClient(http2=_HTTP2, limits=_LIMITS, timeout=timeout, follow_redirects=True)
+
+# Color codes for terminal output, selected once at startup
+COLORS_ON = SimpleNamespace(
+    RED='\033[91m',
+    GREEN='\033[92m',
+    YELLOW='\033[93m',
+    BLUE='\033[94m',
+    MAGENTA='\033[95m',
+    CYAN='\033[96m',
+    WHITE='\033[97m',
+    BOLD='\033[1m',
+    END='\033[0m'
+)
+COLORS_OFF = SimpleNamespace(**{name: "" for name in vars(COLORS_ON)})
+
+# Slotted dataclasses need Python 3.10+, older versions fall back to __dict__
+_DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+@dataclass(**_DATACLASS_SLOTS)
 class LocationData:
     """Data class for storing location information"""
     ip: str
@@ -44,250 +118,611 @@ class LocationData:
     timezone: str = ""
     accuracy: str = "City-level (±50km typical)"
 
+# Output record with every LocationData field at its default, in field order
+_RECORD_TEMPLATE = asdict(LocationData(ip=""))
+
+# (LocationData field, provider response key) pairs for the plain string fields
+_IPAPI_FIELDS = (
+    ("country", "country"),
+    ("country_code", "countryCode"),
+    ("city", "city"),
+    ("region", "regionName"),
+    ("region_code", "region"),
+    ("isp", "isp"),
+    ("organization", "org"),
+    ("asn", "as"),
+    ("timezone", "timezone"),
+)
+_IPINFO_FIELDS = (
+    ("country", "country"),
+    ("city", "city"),
+    ("region", "region"),
+    ("organization", "org"),
+    ("timezone", "timezone"),
+)
+_IPSTACK_FIELDS = (
+    ("country", "country_name"),
+    ("country_code", "country_code"),
+    ("city", "city"),
+    ("region", "region_name"),
+    ("region_code", "region_code"),
+)
+
+def _map_record(data: Dict[str, Any], fields: Tuple[Tuple[str, str], ...], **values: Any) -> Dict[str, Any]:
+    """Build an output record from a provider response and its field map"""
+    record = dict(_RECORD_TEMPLATE)
+    record.update({dst: data.get(src, "") for dst, src in fields})
+    record.update(values)
+    return record
+
+@functools.lru_cache(maxsize=1)
+def _get_cache() -> Optional["Cache"]:
+    """Open the on-disk lookup cache, or return None if it is unavailable"""
+    if Cache is None:
+        return None
+    try:
+        return Cache(CACHE_DIR)
+    except OSError:
+        return None
+
+def cache_get(provider: str, ip: str) -> Optional[Dict[str, Any]]:
+    """Return the cached location record for an IP from a provider, if still fresh"""
+    cache = _get_cache()
+    if cache is None:
+        return None
+    return cache.get((provider, ip))
+
+def cache_set(provider: str, ip: str, data: Union[LocationData, Dict[str, Any]]) -> None:
+    """Store a location (or its output record) for an IP from a provider for CACHE_TTL seconds"""
+    cache = _get_cache()
+    if cache is not None:
+        record = asdict(data) if isinstance(data, LocationData) else data
+        cache.set((provider, ip), record, expire=CACHE_TTL)
+
+def cached_location(method: Callable) -> Callable:
+    """Serve a single-IP record lookup from the disk cache and store fresh results"""
+    @functools.wraps(method)
+    def wrapper(self: "GeoLocator", ip: str) -> Optional[Dict[str, Any]]:
+        provider = type(self).__name__
+        record = cache_get(provider, ip)
+        if record is None:
+            record = method(self, ip)
+            if record is not None:
+                cache_set(provider, ip, record)
+        return record
+    return wrapper
+
+def cached_locations(method: Callable) -> Callable:
+    """Serve get_locations() from the disk cache, only looking up the misses"""
+    @functools.wraps(method)
+    def wrapper(self: "GeoLocator", ips: List[str]) -> List[Optional[LocationData]]:
+        provider = type(self).__name__
+        results: Dict[str, Optional[LocationData]] = {}
+        for ip in ips:
+            record = cache_get(provider, ip)
+            results[ip] = LocationData(**record) if record is not None else None
+        misses = [ip for ip, data in results.items() if data is None]
+        if misses:
+            for ip, data in zip(misses, method(self, misses)):
+                if data is not None:
+                    cache_set(provider, ip, data)
+                results[ip] = data
+        return [results[ip] for ip in ips]
+    return wrapper
+
+class TokenBucket:
+    """Token bucket that paces requests to a steady rate with limited bursts"""
+    
+    def __init__(self, rate_per_sec: float, capacity: float):
+        self.rate = rate_per_sec
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+    
+    def reserve(self) -> float:
+        """Take a token and return how many seconds to wait before using it"""
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            self.tokens -= 1
+            return max(0.0, -self.tokens / self.rate)
+    
+    def take(self) -> None:
+        """Block until a token is available"""
+        delay = self.reserve()
+        if delay:
+            time.sleep(delay)
+    
+    async def acquire(self) -> None:
+        """Wait for a token without blocking the event loop"""
+        delay = self.reserve()
+        if delay:
+            await asyncio.sleep(delay)
+
 class GeoLocator(ABC):
     """Abstract base class for geolocation providers"""
     
-    def __init__(self):
-        self.session = requests.Session()
-        self.session.timeout = 10
+    def __init__(self, colors: SimpleNamespace = COLORS_ON, rate_limit: Optional[int] = None):
+        self.colors = colors
+        self.client = _get_client()
+        self.rate_limit = rate_limit  # requests per minute, None if unlimited
+        self.bucket = TokenBucket(rate_limit / 60.0, rate_limit) if rate_limit else None
     
     @abstractmethod
-    def get_location(self, ip: str) -> Optional[LocationData]:
-        """Get location data for an IP address"""
+    def _location_request(self, ip: str) -> Tuple[str, Dict[str, str]]:
+        """Return the URL and query parameters for a single-IP lookup"""
         pass
-
-class IPAPILocator(GeoLocator):
-    """IP-API.com geolocation provider (free tier)"""
     
-    def __init__(self):
-        super().__init__()
-        self.base_url = "http://ip-api.com/json"
-        self.rate_limit = 45  # requests per minute
+    @abstractmethod
+    def _response_error(self, data: Dict[str, Any]) -> Optional[str]:
+        """Return the error message of a failed provider response, or None"""
+        pass
     
-    def get_location(self, ip: str) -> Optional[LocationData]:
-        """Get location from ip-api.com"""
+    @abstractmethod
+    def _to_record(self, data: Dict[str, Any], ip: str) -> Dict[str, Any]:
+        """Map a provider response object onto the LocationData field names"""
+        pass
+    
+    def _parse_location(self, data: Dict[str, Any], ip: str) -> Optional[LocationData]:
+        """Convert a provider response object into LocationData"""
+        error = self._response_error(data)
+        if error is not None:
+            print(f"{self.colors.RED}Error: {error}{self.colors.END}")
+            return None
+        return LocationData(**self._to_record(data, ip))
+    
+    def _fetch_location(self, ip: str) -> Optional[Dict[str, Any]]:
+        """Fetch and decode the provider response for an IP
+        
+        Returns None if the request failed or the provider reported an error.
+        """
         try:
-            url = f"{self.base_url}/{ip}"
-            response = self.session.get(url)
+            url, params = self._location_request(ip)
+            if self.bucket is not None:
+                self.bucket.take()
+            response = self.client.get(url, params=params)
             response.raise_for_status()
             
-            data = response.json()
-            
-            if data.get('status') == 'fail':
-                print(f"{Colors.RED}Error: {data.get('message', 'API request failed')}{Colors.END}")
+            data = json_loads(response.content)
+            error = self._response_error(data)
+            if error is not None:
+                print(f"{self.colors.RED}Error: {error}{self.colors.END}")
                 return None
-            
-            return LocationData(
-                ip=data.get('query', ip),
-                country=data.get('country', ''),
-                country_code=data.get('countryCode', ''),
-                city=data.get('city', ''),
-                region=data.get('regionName', ''),
-                region_code=data.get('region', ''),
-                latitude=float(data.get('lat', 0)),
-                longitude=float(data.get('lon', 0)),
-                isp=data.get('isp', ''),
-                organization=data.get('org', ''),
-                asn=data.get('as', ''),
-                timezone=data.get('timezone', ''),
-                accuracy="City-level (±50km typical)"
-            )
+            return data
         
-        except requests.RequestException as e:
-            print(f"{Colors.RED}Network error: {e}{Colors.END}")
+        except httpx.HTTPError as e:
+            print(f"{self.colors.RED}Network error: {e}{self.colors.END}")
             return None
         except json.JSONDecodeError:
-            print(f"{Colors.RED}Error: Invalid JSON response{Colors.END}")
+            print(f"{self.colors.RED}Error: Invalid JSON response{self.colors.END}")
             return None
         except Exception as e:
-            print(f"{Colors.RED}Unexpected error: {e}{Colors.END}")
+            print(f"{self.colors.RED}Unexpected error: {e}{self.colors.END}")
             return None
-
-class IPInfoLocator(GeoLocator):
-    """IPInfo.io geolocation provider"""
     
-    def __init__(self, token: str = ""):
-        super().__init__()
-        self.base_url = "https://ipinfo.io"
-        self.token = token
+    @cached_location
+    def get_location_record(self, ip: str) -> Optional[Dict[str, Any]]:
+        """Get location data for an IP address as a plain dict, ready for JSON output
+        
+        The provider response is decoded once and remapped straight into the
+        output record, without building an intermediate LocationData.
+        """
+        data = self._fetch_location(ip)
+        if data is None:
+            return None
+        try:
+            return self._to_record(data, ip)
+        except Exception as e:
+            print(f"{self.colors.RED}Unexpected error: {e}{self.colors.END}")
+            return None
     
     def get_location(self, ip: str) -> Optional[LocationData]:
-        """Get location from ipinfo.io"""
+        """Get location data for an IP address"""
+        record = self.get_location_record(ip)
+        return LocationData(**record) if record is not None else None
+    
+    @cached_locations
+    def get_locations(self, ips: List[str]) -> List[Optional[LocationData]]:
+        """Get location data for several IP addresses, in input order"""
+        return self._fetch_locations(ips)
+    
+    def _fetch_locations(self, ips: List[str]) -> List[Optional[LocationData]]:
+        """Look up several IPs without the cache, providers with a batch endpoint override this"""
+        return self.run_many(ips)
+    
+    async def get_location_async(self, ip: str, client: Optional[httpx.AsyncClient] = None) -> Optional[LocationData]:
+        """Get location data for an IP address without blocking the event loop"""
+        cached = cache_get(type(self).__name__, ip)
+        if cached is not None:
+            return LocationData(**cached)
+        
+        if client is None:
+            async with _async_client() as client:
+                location = await self._fetch_location_async(ip, client)
+        else:
+            location = await self._fetch_location_async(ip, client)
+        if location is not None:
+            cache_set(type(self).__name__, ip, location)
+        return location
+    
+    async def _fetch_location_async(self, ip: str, client: httpx.AsyncClient) -> Optional[LocationData]:
+        """Look up an IP over an async client, without the cache"""
         try:
-            url = f"{self.base_url}/{ip}/json"
-            params = {"token": self.token} if self.token else {}
-            
-            response = self.session.get(url, params=params)
+            url, params = self._location_request(ip)
+            if self.bucket is not None:
+                await self.bucket.acquire()
+            response = await client.get(url, params=params)
             response.raise_for_status()
             
-            data = response.json()
-            
-            # Handle error responses
-            if 'error' in data:
-                print(f"{Colors.RED}Error: {data['error']['message']}{Colors.END}")
-                return None
-            
-            # Parse coordinates
-            lat, lon = 0.0, 0.0
-            if 'loc' in data and data['loc']:
-                try:
-                    coords = data['loc'].split(',')
-                    if len(coords) == 2:
-                        lat, lon = float(coords[0]), float(coords[1])
-                except ValueError:
-                    pass
-            
-            return LocationData(
-                ip=data.get('ip', ip),
-                country=data.get('country', ''),
-                city=data.get('city', ''),
-                region=data.get('region', ''),
-                latitude=lat,
-                longitude=lon,
-                organization=data.get('org', ''),
-                timezone=data.get('timezone', ''),
-                accuracy="City-level (±50km typical)"
-            )
+            data = json_loads(response.content)
+            return self._parse_location(data, ip)
         
-        except requests.RequestException as e:
-            print(f"{Colors.RED}Network error: {e}{Colors.END}")
+        except httpx.HTTPError as e:
+            print(f"{self.colors.RED}Network error: {e}{self.colors.END}")
             return None
         except json.JSONDecodeError:
-            print(f"{Colors.RED}Error: Invalid JSON response{Colors.END}")
+            print(f"{self.colors.RED}Error: Invalid JSON response{self.colors.END}")
             return None
         except Exception as e:
-            print(f"{Colors.RED}Unexpected error: {e}{Colors.END}")
+            print(f"{self.colors.RED}Unexpected error: {e}{self.colors.END}")
             return None
+    
+    async def _run_many_async(self, ips: List[str]) -> List[Optional[LocationData]]:
+        """Look up IPs concurrently, at most rate_limit (or MAX_CONCURRENCY) requests in flight"""
+        semaphore = asyncio.Semaphore(self.rate_limit or MAX_CONCURRENCY)
+        
+        async with _async_client() as client:
+            async def locate(ip: str) -> Optional[LocationData]:
+                async with semaphore:
+                    return await self._fetch_location_async(ip, client)
+            
+            return await asyncio.gather(*(locate(ip) for ip in ips))
+    
+    def run_many(self, ips: List[str]) -> List[Optional[LocationData]]:
+        """Look up several IPs concurrently over one async client, in input order, without the cache"""
+        return asyncio.run(self._run_many_async(ips))
+
+class IPAPILocator(GeoLocator):
+    """IP-API.com geolocation provider (free tier)"""
+    
+    def __init__(self, colors: SimpleNamespace = COLORS_ON):
+        super().__init__(colors, rate_limit=45)
+        self.base_url = "http://ip-api.com/json"
+        self.batch_url = "http://ip-api.com/batch"
+        # The batch endpoint has its own, lower limit of 15 requests per minute
+        self.batch_bucket = TokenBucket(15 / 60.0, 15)
+    
+    def _response_error(self, data: Dict[str, Any]) -> Optional[str]:
+        """Return the error message of a failed ip-api.com response"""
+        if data.get('status') == 'fail':
+            return data.get('message', 'API request failed')
+        return None
+    
+    def _to_record(self, data: Dict[str, Any], ip: str) -> Dict[str, Any]:
+        """Map an ip-api.com response object onto the LocationData fields"""
+        return _map_record(
+            data, _IPAPI_FIELDS,
+            ip=data.get('query', ip),
+            latitude=float(data.get('lat') or 0),
+            longitude=float(data.get('lon') or 0)
+        )
+    
+    def _location_request(self, ip: str) -> Tuple[str, Dict[str, str]]:
+        """Return the ip-api.com lookup URL for an IP"""
+        return f"{self.base_url}/{ip}", {}
+    
+    def _fetch_locations(self, ips: List[str]) -> List[Optional[LocationData]]:
+        """Get locations from the ip-api.com batch endpoint, 100 IPs per request"""
+        results: List[Optional[LocationData]] = []
+        for start in range(0, len(ips), BATCH_SIZE):
+            chunk = ips[start:start + BATCH_SIZE]
+            try:
+                self.batch_bucket.take()
+                response = self.client.post(self.batch_url, json=[{"query": ip} for ip in chunk])
+                response.raise_for_status()
+                
+                data = json_loads(response.content)
+                results.extend([self._parse_location(item, ip) for item, ip in zip(data, chunk)])
+                continue
+            
+            except httpx.HTTPError as e:
+                print(f"{self.colors.RED}Network error: {e}{self.colors.END}")
+            except json.JSONDecodeError:
+                print(f"{self.colors.RED}Error: Invalid JSON response{self.colors.END}")
+            except Exception as e:
+                print(f"{self.colors.RED}Unexpected error: {e}{self.colors.END}")
+            results.extend([None] * len(chunk))
+        
+        return results
+
+class IPInfoLocator(GeoLocator):
+    """IPInfo.io geolocation provider"""
+    
+    def __init__(self, token: str = "", colors: SimpleNamespace = COLORS_ON):
+        super().__init__(colors)
+        self.base_url = "https://ipinfo.io"
+        self.token = token
+    
+    def _response_error(self, data: Dict[str, Any]) -> Optional[str]:
+        """Return the error message of a failed ipinfo.io response"""
+        if 'error' in data:
+            return data['error']['message']
+        return None
+    
+    def _to_record(self, data: Dict[str, Any], ip: str) -> Dict[str, Any]:
+        """Map an ipinfo.io response object onto the LocationData fields"""
+        # Parse coordinates
+        lat, lon = 0.0, 0.0
+        if 'loc' in data and data['loc']:
+            try:
+                coords = data['loc'].split(',')
+                if len(coords) == 2:
+                    lat, lon = float(coords[0]), float(coords[1])
+            except ValueError:
+                pass
+        
+        return _map_record(data, _IPINFO_FIELDS, ip=data.get('ip', ip), latitude=lat, longitude=lon)
+    
+    def _location_request(self, ip: str) -> Tuple[str, Dict[str, str]]:
+        """Return the ipinfo.io lookup URL and token parameter for an IP"""
+        params = {"token": self.token} if self.token else {}
+        return f"{self.base_url}/{ip}/json", params
+    
+    def _fetch_locations(self, ips: List[str]) -> List[Optional[LocationData]]:
+        """Get locations from the ipinfo.io batch endpoint, 100 IPs per request"""
+        # The batch endpoint is only available to authenticated requests
+        if not self.token:
+            return super()._fetch_locations(ips)
+        
+        results: List[Optional[LocationData]] = []
+        for start in range(0, len(ips), BATCH_SIZE):
+            chunk = ips[start:start + BATCH_SIZE]
+            try:
+                response = self.client.post(
+                    f"{self.base_url}/batch",
+                    params={"token": self.token},
+                    json=chunk
+                )
+                response.raise_for_status()
+                
+                data = json_loads(response.content)
+                results.extend([
+                    self._parse_location(data[ip], ip) if ip in data else None
+                    for ip in chunk
+                ])
+                continue
+            
+            except httpx.HTTPError as e:
+                print(f"{self.colors.RED}Network error: {e}{self.colors.END}")
+            except json.JSONDecodeError:
+                print(f"{self.colors.RED}Error: Invalid JSON response{self.colors.END}")
+            except Exception as e:
+                print(f"{self.colors.RED}Unexpected error: {e}{self.colors.END}")
+            results.extend([None] * len(chunk))
+        
+        return results
 
 class IPStackLocator(GeoLocator):
     """IPStack.com geolocation provider"""
     
-    def __init__(self, token: str):
-        super().__init__()
+    def __init__(self, token: str, colors: SimpleNamespace = COLORS_ON):
+        super().__init__(colors)
         self.base_url = "http://api.ipstack.com"
         self.token = token
     
-    def get_location(self, ip: str) -> Optional[LocationData]:
-        """Get location from ipstack.com"""
-        try:
-            url = f"{self.base_url}/{ip}"
-            params = {"access_key": self.token}
-            
-            response = self.session.get(url, params=params)
-            response.raise_for_status()
-            
-            data = response.json()
-            
-            if 'error' in data:
-                print(f"{Colors.RED}Error: {data['error']['info']}{Colors.END}")
-                return None
-            
-            return LocationData(
-                ip=data.get('ip', ip),
-                country=data.get('country_name', ''),
-                country_code=data.get('country_code', ''),
-                city=data.get('city', ''),
-                region=data.get('region_name', ''),
-                region_code=data.get('region_code', ''),
-                latitude=float(data.get('latitude', 0)),
-                longitude=float(data.get('longitude', 0)),
-                timezone=data.get('time_zone', {}).get('id', ''),
-                accuracy="City-level (±50km typical)"
-            )
-        
-        except requests.RequestException as e:
-            print(f"{Colors.RED}Network error: {e}{Colors.END}")
-            return None
-        except json.JSONDecodeError:
-            print(f"{Colors.RED}Error: Invalid JSON response{Colors.END}")
-            return None
-        except Exception as e:
-            print(f"{Colors.RED}Unexpected error: {e}{Colors.END}")
-            return None
+    def _location_request(self, ip: str) -> Tuple[str, Dict[str, str]]:
+        """Return the ipstack.com lookup URL and access key for an IP"""
+        return f"{self.base_url}/{ip}", {"access_key": self.token}
+    
+    def _response_error(self, data: Dict[str, Any]) -> Optional[str]:
+        """Return the error message of a failed ipstack.com response"""
+        if 'error' in data:
+            return data['error']['info']
+        return None
+    
+    def _to_record(self, data: Dict[str, Any], ip: str) -> Dict[str, Any]:
+        """Map an ipstack.com response object onto the LocationData fields"""
+        return _map_record(
+            data, _IPSTACK_FIELDS,
+            ip=data.get('ip', ip),
+            latitude=float(data.get('latitude') or 0),
+            longitude=float(data.get('longitude') or 0),
+            timezone=(data.get('time_zone') or {}).get('id', '')
+        )
 
-def validate_ip(ip: str) -> bool:
-    """Validate IP address format"""
+# RFC 1918 networks with their analysis names and descriptions, checked in order
+_RFC1918_NETWORKS = [
+    (ipaddress.IPv4Network("10.0.0.0/8"), "Private Class A", "large private network"),
+    (ipaddress.IPv4Network("172.16.0.0/12"), "Private Class B", "medium private network"),
+    (ipaddress.IPv4Network("192.168.0.0/16"), "Private Class C", "small private network"),
+]
+
+# RFC 1918 ranges as inclusive (low, high) integer bounds
+_PRIV_RANGES = [
+    (int(network.network_address), int(network.broadcast_address), name, f"{desc} ({network})")
+    for network, name, desc in _RFC1918_NETWORKS
+]
+
+IPAddress = Union[ipaddress.IPv4Address, ipaddress.IPv6Address]
+
+def _ipv4_masks(networks: List[ipaddress.IPv4Network]) -> List[Tuple[int, int]]:
+    """Convert IPv4 networks into (network, netmask) integer pairs"""
+    return [(int(network.network_address), int(network.netmask)) for network in networks]
+
+# The running interpreter's own special-purpose IPv4 tables, so the fast path
+# always agrees with IPv4Address.is_loopback, is_link_local and is_private
+_IPV4_CONSTANTS = ipaddress.IPv4Address._constants
+_IPV4_LOOPBACK_MASK, = _ipv4_masks([_IPV4_CONSTANTS._loopback_network])
+_IPV4_LINK_LOCAL_MASK, = _ipv4_masks([_IPV4_CONSTANTS._linklocal_network])
+_IPV4_PRIVATE_MASKS = _ipv4_masks(_IPV4_CONSTANTS._private_networks)
+# Newer Pythons carve addresses such as 192.0.0.9 out of the private networks
+_IPV4_PRIVATE_EXCEPTION_MASKS = _ipv4_masks(getattr(_IPV4_CONSTANTS, "_private_networks_exceptions", []))
+
+def _ipv4_to_int(ip: str) -> int:
+    """Return the integer value of a dotted-quad IPv4 address, or -1 if it isn't one"""
+    try:
+        return struct.unpack(">I", socket.inet_pton(socket.AF_INET, ip))[0]
+    except (OSError, TypeError, ValueError):
+        return -1
+
+def _classify_ipv4(value: int) -> str:
+    """Classify an IPv4 address given as an integer, matching classify_ip()"""
+    network, netmask = _IPV4_LOOPBACK_MASK
+    if value & netmask == network:
+        return "loopback"
+    network, netmask = _IPV4_LINK_LOCAL_MASK
+    if value & netmask == network:
+        return "link_local"
+    for network, netmask in _IPV4_PRIVATE_EXCEPTION_MASKS:
+        if value & netmask == network:
+            return "public"
+    for network, netmask in _IPV4_PRIVATE_MASKS:
+        if value & netmask == network:
+            return "private"
+    return "public"
+
+@functools.lru_cache(maxsize=4096)
+def classify_ip(ip: str) -> Tuple[Optional[IPAddress], str]:
+    """Parse an IP address once and classify it
+    
+    Returns the parsed address (None if invalid) and one of "invalid",
+    "public", "loopback", "link_local" or "private".
+    """
+    # Dotted-quad IPv4 is parsed in C, ipaddress only handles the rest
+    value = _ipv4_to_int(ip)
+    if value >= 0:
+        return ipaddress.IPv4Address(value), _classify_ipv4(value)
+    
     try:
-        ipaddress.ip_address(ip)
-        # Check if it's a public IP
         ip_obj = ipaddress.ip_address(ip)
-        return not (ip_obj.is_private or ip_obj.is_loopback or ip_obj.is_link_local)
     except ValueError:
-        return False
+        return None, "invalid"
+    
+    if ip_obj.is_loopback:
+        return ip_obj, "loopback"
+    if ip_obj.is_link_local:
+        return ip_obj, "link_local"
+    if ip_obj.is_private:
+        return ip_obj, "private"
+    return ip_obj, "public"
+
+def classify_ips_bulk(ips: List[str]) -> List[str]:
+    """Classify many IP addresses at once
+    
+    Returns the classify_ip() kind of every address. From
+    BULK_CLASSIFY_THRESHOLD addresses on, and when NumPy is installed, IPv4
+    addresses are classified with vectorized integer masks and anything else
+    falls back to classify_ip().
+    """
+    if len(ips) < BULK_CLASSIFY_THRESHOLD:
+        return [classify_ip(ip)[1] for ip in ips]
+    try:
+        import numpy as np
+    except ImportError:
+        return [classify_ip(ip)[1] for ip in ips]
+    
+    parsed = np.array([_ipv4_to_int(ip) for ip in ips], dtype=np.int64)
+    is_ipv4 = parsed >= 0
+    values = parsed.astype(np.uint32)
+    
+    network, netmask = _IPV4_LOOPBACK_MASK
+    is_loopback = (values & netmask) == network
+    network, netmask = _IPV4_LINK_LOCAL_MASK
+    is_link_local = (values & netmask) == network
+    is_private = np.zeros(len(values), dtype=bool)
+    for network, netmask in _IPV4_PRIVATE_MASKS:
+        is_private |= (values & netmask) == network
+    for network, netmask in _IPV4_PRIVATE_EXCEPTION_MASKS:
+        is_private &= (values & netmask) != network
+    
+    kinds = np.select(
+        [is_loopback, is_link_local, is_private],
+        ["loopback", "link_local", "private"],
+        default="public"
+    ).astype(object)
+    for index in np.flatnonzero(~is_ipv4):
+        kinds[index] = classify_ip(ips[index])[1]
+    return kinds.tolist()
+
+def validate_ip(ip: str) -> bool:
+    """Validate IP address format"""
+    # Check if it's a public IP
+    return classify_ip(ip)[1] == "public"
 
 def is_valid_ip(ip: str) -> bool:
     """Check if IP address format is valid (public or private)"""
-    try:
-        ipaddress.ip_address(ip)
-        return True
-    except ValueError:
-        return False
+    return classify_ip(ip)[1] != "invalid"
 
-def analyze_private_ip(ip: str) -> Optional[LocationData]:
-    """Analyze private IP and provide network information"""
-    try:
-        ip_obj = ipaddress.ip_address(ip)
-        
-        if ip_obj.is_loopback:
-            network_type = "Loopback"
-            description = "localhost/loopback address"
-        elif ip_obj.is_link_local:
-            network_type = "Link-Local"
-            description = "automatically assigned local address"
-        elif ip_obj.is_private:
-            if ip_obj in ipaddress.ip_network("10.0.0.0/8"):
-                network_type = "Private Class A"
-                description = "large private network (10.0.0.0/8)"
-            elif ip_obj in ipaddress.ip_network("172.16.0.0/12"):
-                network_type = "Private Class B"
-                description = "medium private network (172.16.0.0/12)"
-            elif ip_obj in ipaddress.ip_network("192.168.0.0/16"):
-                network_type = "Private Class C"
-                description = "small private network (192.168.0.0/16)"
-            else:
-                network_type = "Private"
-                description = "private network address"
-        else:
-            return None
-        
-        return LocationData(
-            ip=ip,
-            country="Local Network",
-            city=network_type,
-            region=description,
-            accuracy="Network-level identification only",
-            organization="Private/Local Network",
-            timezone="System timezone"
-        )
-    except ValueError:
+def analyze_private_ip(ip_obj: IPAddress) -> Optional[LocationData]:
+    """Analyze an already parsed private IP and provide network information"""
+    if ip_obj.is_loopback:
+        network_type = "Loopback"
+        description = "localhost/loopback address"
+    elif ip_obj.is_link_local:
+        network_type = "Link-Local"
+        description = "automatically assigned local address"
+    elif ip_obj.is_private:
+        network_type = "Private"
+        description = "private network address"
+        if ip_obj.version == 4:
+            value = int(ip_obj)
+            for low, high, name, desc in _PRIV_RANGES:
+                if low <= value <= high:
+                    network_type, description = name, desc
+                    break
+    else:
         return None
-
-def get_public_ip() -> Optional[str]:
-    """Get the public IP address of the current machine"""
-    services = [
-        "https://api.ipify.org?format=text",
-        "https://ipinfo.io/ip",
-        "https://icanhazip.com",
-        "https://ident.me"
-    ]
     
-    for service in services:
-        try:
-            response = requests.get(service, timeout=5)
+    return LocationData(
+        ip=str(ip_obj),
+        country="Local Network",
+        city=network_type,
+        region=description,
+        accuracy="Network-level identification only",
+        organization="Private/Local Network",
+        timezone="System timezone"
+    )
+
+async def get_public_ip_async() -> Optional[str]:
+    """Get the public IP address of the current machine, querying all services at once"""
+    async with _async_client(timeout=5) as client:
+        async def fetch(service: str) -> str:
+            response = await client.get(service)
             response.raise_for_status()
-            ip = response.text.strip()
-            if validate_ip(ip):
-                return ip
-        except:
-            continue
+            return response.text.strip()
+        
+        tasks = [asyncio.ensure_future(fetch(service)) for service in PUBLIC_IP_SERVICES]
+        try:
+            # The first valid answer wins, the remaining requests are cancelled
+            for next_done in asyncio.as_completed(tasks):
+                try:
+                    ip = await next_done
+                except Exception:
+                    continue
+                if validate_ip(ip):
+                    return ip
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
     
     return None
 
-def print_simple_format(data: LocationData) -> None:
+def get_public_ip() -> Optional[str]:
+    """Get the public IP address of the current machine"""
+    # The async client has no transport retries, so a dead service is not probed twice
+    return asyncio.run(get_public_ip_async())
+
+def print_simple_format(data: LocationData, colors: SimpleNamespace = COLORS_ON) -> None:
     """Print location data in simple format"""
-    print(f"{Colors.BOLD}IP Location Information{Colors.END}")
-    print("=" * 50)
-    print(f"{Colors.CYAN}IP Address:{Colors.END} {data.ip}")
+    bold, cyan, yellow, end = colors.BOLD, colors.CYAN, colors.YELLOW, colors.END
+    lines = [
+        f"{bold}IP Location Information{end}",
+        "=" * 50,
+        f"{cyan}IP Address:{end} {data.ip}"
+    ]
     
     if data.country:
         location_parts = [data.city, data.region, data.country]
@@ -295,43 +730,30 @@ def print_simple_format(data: LocationData) -> None:
         location_str = ", ".join(location_parts)
         if data.country_code:
             location_str += f" ({data.country_code})"
-        print(f"{Colors.CYAN}Location:{Colors.END} {location_str}")
+        lines.append(f"{cyan}Location:{end} {location_str}")
     
     if data.latitude and data.longitude:
-        print(f"{Colors.CYAN}Coordinates:{Colors.END} {data.latitude:.6f}, {data.longitude:.6f}")
+        lines.append(f"{cyan}Coordinates:{end} {data.latitude:.6f}, {data.longitude:.6f}")
     
     if data.isp:
-        print(f"{Colors.CYAN}ISP:{Colors.END} {data.isp}")
+        lines.append(f"{cyan}ISP:{end} {data.isp}")
     
     if data.organization:
-        print(f"{Colors.CYAN}Organization:{Colors.END} {data.organization}")
+        lines.append(f"{cyan}Organization:{end} {data.organization}")
     
     if data.asn:
-        print(f"{Colors.CYAN}ASN:{Colors.END} {data.asn}")
+        lines.append(f"{cyan}ASN:{end} {data.asn}")
     
     if data.timezone:
-        print(f"{Colors.CYAN}Timezone:{Colors.END} {data.timezone}")
-    
-    print(f"{Colors.YELLOW}Accuracy:{Colors.END} {data.accuracy}")
-
-def print_json_format(data: LocationData) -> None:
-    """Print location data in JSON format"""
-    json_data = {
-        "ip": data.ip,
-        "country": data.country,
-        "country_code": data.country_code,
-        "city": data.city,
-        "region": data.region,
-        "region_code": data.region_code,
-        "latitude": data.latitude,
-        "longitude": data.longitude,
-        "isp": data.isp,
-        "organization": data.organization,
-        "asn": data.asn,
-        "timezone": data.timezone,
-        "accuracy": data.accuracy
-    }
-    print(json.dumps(json_data, indent=2))
+        lines.append(f"{cyan}Timezone:{end} {data.timezone}")
+    
+    lines.append(f"{yellow}Accuracy:{end} {data.accuracy}")
+    sys.stdout.write("\n".join(lines) + "\n")
+
+def print_json_format(data: Union[LocationData, Dict[str, Any]]) -> None:
+    """Print location data (or an already mapped record) in JSON format"""
+    record = asdict(data) if isinstance(data, LocationData) else data
+    sys.stdout.write(json_dumps(record) + "\n")
 
 def print_table_format(data: LocationData) -> None:
     """Print location data in table format"""
@@ -348,49 +770,105 @@ def print_table_format(data: LocationData) -> None:
         ("Accuracy", data.accuracy)
     ]
     
-    # Filter out empty values
-    table_data = [(field, value) for field, value in table_data if value and value != "N/A"]
-    
-    if not table_data:
+    # Filter out empty values and calculate column widths in one pass
+    rows = []
+    max_field_width = max_value_width = 0
+    for field, value in table_data:
+        if not value or value == "N/A":
+            continue
+        text = str(value)
+        rows.append((field, text))
+        if len(field) > max_field_width:
+            max_field_width = len(field)
+        if len(text) > max_value_width:
+            max_value_width = len(text)
+    
+    if not rows:
         print("No data available")
         return
     
-    # Calculate column widths
-    max_field_width = max(len(field) for field, _ in table_data)
-    max_value_width = max(len(str(value)) for _, value in table_data)
+    field_rule = "─" * (max_field_width + 2)
+    value_rule = "─" * (max_value_width + 2)
     
     # Print table
-    print("┌" + "─" * (max_field_width + 2) + "┬" + "─" * (max_value_width + 2) + "┐")
-    print(f"│ {'Field':<{max_field_width}} │ {'Value':<{max_value_width}} │")
-    print("├" + "─" * (max_field_width + 2) + "┼" + "─" * (max_value_width + 2) + "┤")
+    lines = [
+        "┌" + field_rule + "┬" + value_rule + "┐",
+        f"│ {'Field':<{max_field_width}} │ {'Value':<{max_value_width}} │",
+        "├" + field_rule + "┼" + value_rule + "┤"
+    ]
     
-    for field, value in table_data:
-        print(f"│ {field:<{max_field_width}} │ {str(value):<{max_value_width}} │")
+    for field, text in rows:
+        lines.append(f"│ {field:<{max_field_width}} │ {text:<{max_value_width}} │")
     
-    print("└" + "─" * (max_field_width + 2) + "┴" + "─" * (max_value_width + 2) + "┘")
+    lines.append("└" + field_rule + "┴" + value_rule + "┘")
+    sys.stdout.write("\n".join(lines) + "\n")
 
-def print_location_data(data: LocationData, format_type: str) -> None:
+def print_location_data(data: LocationData, format_type: str, colors: SimpleNamespace = COLORS_ON) -> None:
     """Print location data in the specified format"""
     if format_type == "json":
         print_json_format(data)
     elif format_type == "table":
         print_table_format(data)
     else:
-        print_simple_format(data)
+        print_simple_format(data, colors)
     
-    # Add Google Maps link if coordinates are available
-    if data.latitude and data.longitude:
-        maps_url = f"https://maps.google.com/?q={data.latitude:.6f},{data.longitude:.6f}"
-        print(f"\n{Colors.GREEN}Google Maps:{Colors.END} {maps_url}")
+    print_maps_link(data.latitude, data.longitude, colors)
+
+def print_maps_link(latitude: float, longitude: float, colors: SimpleNamespace = COLORS_ON) -> None:
+    """Print a Google Maps link if coordinates are available"""
+    if latitude and longitude:
+        maps_url = f"https://maps.google.com/?q={latitude:.6f},{longitude:.6f}"
+        print(f"\n{colors.GREEN}Google Maps:{colors.END} {maps_url}")
 
-def show_accuracy_info():
+def show_accuracy_info(colors: SimpleNamespace = COLORS_ON):
     """Show accuracy information"""
-    print(f"\n{Colors.YELLOW}IP Geolocation Accuracy Information:{Colors.END}")
+    print(f"\n{colors.YELLOW}IP Geolocation Accuracy Information:{colors.END}")
     print("• Country level: 95-99% accurate")
     print("• City level: 55-80% accurate")
     print("• Precise location: Not reliable due to privacy protections")
     print(f"• VPNs/Proxies: Show server location, not user location")
 
+def create_locator(provider: str, token: Optional[str], colors: SimpleNamespace = COLORS_ON) -> GeoLocator:
+    """Create the geolocation provider selected on the command line"""
+    if provider == "ipinfo":
+        return IPInfoLocator(token or "", colors)
+    if provider == "ipstack":
+        if not token:
+            print(f"{colors.RED}Error: IPStack requires an API token (use -t TOKEN){colors.END}")
+            sys.exit(1)
+        return IPStackLocator(token, colors)
+    return IPAPILocator(colors)
+
+def locate_many(ips: List[str], provider: str, token: Optional[str], format_type: str,
+                colors: SimpleNamespace = COLORS_ON) -> None:
+    """Locate several IP addresses, batching the public ones into provider requests"""
+    kinds = dict(zip(ips, classify_ips_bulk(ips)))
+    invalid = [ip for ip, kind in kinds.items() if kind == "invalid"]
+    if invalid:
+        print(f"{colors.RED}Error: Invalid IP address format: {', '.join(invalid)}{colors.END}")
+        sys.exit(1)
+    
+    # Private IPs are analyzed locally, only public ones go to the provider
+    public_ips = [ip for ip, kind in kinds.items() if kind == "public"]
+    results: Dict[str, Optional[LocationData]] = {}
+    if public_ips:
+        locator = create_locator(provider, token, colors)
+        print(f"{colors.BLUE}Locating {len(public_ips)} IPs using {provider}...{colors.END}")
+        results = dict(zip(public_ips, locator.get_locations(public_ips)))
+    
+    failed = False
+    for ip in ips:
+        print()
+        location_data = results[ip] if ip in results else analyze_private_ip(classify_ip(ip)[0])
+        if not location_data:
+            print(f"{colors.RED}Failed to get location data for {ip}{colors.END}")
+            failed = True
+            continue
+        print_location_data(location_data, format_type, colors)
+    
+    if failed:
+        sys.exit(1)
+
 def main():
     parser = argparse.ArgumentParser(
         description="IP Location Detector - Get geographical information for IP addresses",
@@ -399,6 +877,8 @@ def main():
 Examples:
   %(prog)s                              # Detect your public IP location
   %(prog)s -ip 8.8.8.8                  # Locate specific IP
+  %(prog)s -ip 8.8.8.8,1.1.1.1          # Locate several IPs in one batch
+  %(prog)s -i ips.txt                   # Locate every IP listed in a file
   %(prog)s -ip 1.1.1.1 -f json          # JSON output format
   %(prog)s -ip 8.8.8.8 -f table         # Table output format
   %(prog)s -ip 8.8.8.8 -p ipinfo -t TOKEN  # Use ipinfo.io with token
@@ -407,7 +887,14 @@ Examples:
     
     parser.add_argument(
         "-ip", "--ip-address",
-        help="IP address to locate (leave empty to detect your public IP)"
+        help="IP address to locate, or a comma-separated list (leave empty to detect your public IP)"
+    )
+    
+    parser.add_argument(
+        "-i", "--input",
+        type=argparse.FileType("r"),
+        metavar="FILE",
+        help="File with one IP address per line to locate (use - for stdin)"
     )
     
     parser.add_argument(
@@ -444,74 +931,90 @@ Examples:
     args = parser.parse_args()
     
     # Disable colors if requested
-    if args.no_color:
-        Colors.RED = Colors.GREEN = Colors.YELLOW = Colors.BLUE = ""
-        Colors.MAGENTA = Colors.CYAN = Colors.WHITE = Colors.BOLD = Colors.END = ""
+    colors = COLORS_OFF if args.no_color else COLORS_ON
+    
+    try:
+        run(args, colors)
+    except KeyboardInterrupt:
+        print(f"\n{colors.YELLOW}Operation cancelled by user{colors.END}")
+        sys.exit(0)
+    except Exception as e:
+        print(f"{colors.RED}Unexpected error: {e}{colors.END}")
+        sys.exit(1)
+
+def run(args: argparse.Namespace, colors: SimpleNamespace = COLORS_ON) -> None:
+    """Locate the IP addresses selected on the command line"""
+    # Several comma-separated IPs, or a file of them, are looked up in batches
+    target_ips = [ip.strip() for ip in (args.ip_address or "").split(",") if ip.strip()]
+    if args.input:
+        with args.input:
+            target_ips += [line.strip() for line in args.input if line.strip()]
+    if len(target_ips) > 1 or args.input:
+        locate_many(target_ips, args.provider, args.token, args.format, colors)
+        return
     
     # Get target IP
-    target_ip = args.ip_address
+    target_ip = target_ips[0] if target_ips else None
     if not target_ip:
-        print(f"{Colors.BLUE}No IP provided, detecting your public IP...{Colors.END}")
+        print(f"{colors.BLUE}No IP provided, detecting your public IP...{colors.END}")
         target_ip = get_public_ip()
         if not target_ip:
-            print(f"{Colors.RED}Error: Could not detect public IP address{Colors.END}")
+            print(f"{colors.RED}Error: Could not detect public IP address{colors.END}")
             sys.exit(1)
-        print(f"{Colors.GREEN}Your public IP: {target_ip}{Colors.END}\n")
+        print(f"{colors.GREEN}Your public IP: {target_ip}{colors.END}\n")
     
     # Validate IP address format
-    if not is_valid_ip(target_ip):
-        print(f"{Colors.RED}Error: Invalid IP address format: {target_ip}{Colors.END}")
+    ip_obj, kind = classify_ip(target_ip)
+    if kind == "invalid":
+        print(f"{colors.RED}Error: Invalid IP address format: {target_ip}{colors.END}")
         sys.exit(1)
     
     # Check if it's a private IP and handle accordingly
-    if not validate_ip(target_ip):
-        print(f"{Colors.YELLOW}Private/Local IP detected: {target_ip}{Colors.END}")
-        print(f"{Colors.BLUE}Analyzing local network information...{Colors.END}\n")
+    if kind != "public":
+        print(f"{colors.YELLOW}Private/Local IP detected: {target_ip}{colors.END}")
+        print(f"{colors.BLUE}Analyzing local network information...{colors.END}\n")
         
-        location_data = analyze_private_ip(target_ip)
+        location_data = analyze_private_ip(ip_obj)
         if location_data:
-            print_location_data(location_data, args.format)
-            print(f"\n{Colors.YELLOW}Note: Private IPs cannot be geolocated using external APIs{Colors.END}")
-            print(f"{Colors.CYAN}This analysis is based on RFC 1918 private network ranges{Colors.END}")
+            print_location_data(location_data, args.format, colors)
+            print(f"\n{colors.YELLOW}Note: Private IPs cannot be geolocated using external APIs{colors.END}")
+            print(f"{colors.CYAN}This analysis is based on RFC 1918 private network ranges{colors.END}")
         else:
-            print(f"{Colors.RED}Error: Could not analyze IP address{Colors.END}")
+            print(f"{colors.RED}Error: Could not analyze IP address{colors.END}")
         
         sys.exit(0)
     
     # Create locator based on provider
-    locator = None
-    if args.provider == "ipapi":
-        locator = IPAPILocator()
-    elif args.provider == "ipinfo":
-        locator = IPInfoLocator(args.token or "")
-    elif args.provider == "ipstack":
-        if not args.token:
-            print(f"{Colors.RED}Error: IPStack requires an API token (use -t TOKEN){Colors.END}")
-            sys.exit(1)
-        locator = IPStackLocator(args.token)
+    locator = create_locator(args.provider, args.token, colors)
     
     # Get location data
-    print(f"{Colors.BLUE}Locating IP {target_ip} using {args.provider}...{Colors.END}")
+    print(f"{colors.BLUE}Locating IP {target_ip} using {args.provider}...{colors.END}")
+    
+    # JSON output is remapped straight from the provider response
+    if args.format == "json":
+        record = locator.get_location_record(target_ip)
+        if not record:
+            print(f"{colors.RED}Failed to get location data{colors.END}")
+            sys.exit(1)
+        
+        print()
+        print_json_format(record)
+        print_maps_link(record["latitude"], record["longitude"], colors)
+        return
+    
     location_data = locator.get_location(target_ip)
     
     if not location_data:
-        print(f"{Colors.RED}Failed to get location data{Colors.END}")
+        print(f"{colors.RED}Failed to get location data{colors.END}")
         sys.exit(1)
     
     # Print results
     print()
-    print_location_data(location_data, args.format)
+    print_location_data(location_data, args.format, colors)
     
     # Show accuracy information
     if args.format == "simple":
-        show_accuracy_info()
+        show_accuracy_info(colors)
 
 if __name__ == "__main__":
-    try:
-        main()
-    except KeyboardInterrupt:
-        print(f"\n{Colors.YELLOW}Operation cancelled by user{Colors.END}")
-        sys.exit(0)
-    except Exception as e:
-        print(f"{Colors.RED}Unexpected error: {e}{Colors.END}")
-        sys.exit(1)
+    main()
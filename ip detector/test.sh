@@ -11,7 +11,7 @@ if ! command -v python3 &> /dev/null; then
 fi
 
 # Install requirements if not already installed
-if ! python3 -c "import requests" 2>/dev/null; then
+if ! python3 -c "import httpx" 2>/dev/null; then
     echo "Installing required packages..."
     pip3 install -r requirements.txt
     echo ""
@@ -77,6 +77,91 @@ echo "-----------------------"
 python3 ip_locator.py -ip 8.8.8.8 --no-color
 echo ""
 
+# Test 10: Batch lookup
+echo "Test 10: Batch lookup of several IPs"
+echo "------------------------------------"
+python3 ip_locator.py -ip 8.8.8.8,1.1.1.1,10.0.0.1
+echo ""
+
+# Test 11: IPv4 fast path matches ipaddress
+echo "Test 11: classify_ip() fast path vs ipaddress"
+echo "---------------------------------------------"
+python3 - <<'PYEOF'
+import ipaddress
+import random
+import sys
+from ip_locator import classify_ip
+
+def reference(ip):
+    try:
+        ip_obj = ipaddress.ip_address(ip)
+    except ValueError:
+        return "invalid"
+    if ip_obj.is_loopback:
+        return "loopback"
+    if ip_obj.is_link_local:
+        return "link_local"
+    if ip_obj.is_private:
+        return "private"
+    return "public"
+
+rng = random.Random(0)
+ips = [str(ipaddress.IPv4Address(rng.getrandbits(32))) for _ in range(200000)]
+ips += [
+    "0.0.0.0", "255.255.255.255", "127.0.0.1", "169.254.1.1", "10.0.0.0",
+    "172.15.255.255", "172.16.0.0", "172.31.255.255", "172.32.0.0",
+    "192.0.0.7", "192.0.0.8", "192.0.0.170", "192.0.0.171", "192.0.0.172",
+    "192.0.0.9", "192.0.0.10", "192.0.0.100", "192.0.0.255",
+    "192.168.0.1", "100.64.0.1", "198.18.0.1", "240.0.0.1", "224.0.0.1",
+    "01.2.3.4", "1.2.3", "1.2.3.4.5", "256.1.1.1", " 1.2.3.4", "1.2.3.4 ",
+    "8.8.8.8\x00", "", "::1", "fe80::1", "fc00::1", "2001:4860:4860::8888",
+    "::ffff:10.0.0.1", "not an ip",
+]
+
+mismatches = [ip for ip in ips if classify_ip(ip)[1] != reference(ip)]
+if mismatches:
+    print(f"FAIL: {len(mismatches)} mismatches, e.g. {mismatches[:5]!r}")
+    sys.exit(1)
+print(f"PASS: {len(ips)} addresses classified identically")
+PYEOF
+echo ""
+
+# Test 12: Vectorized bulk classification matches classify_ip()
+echo "Test 12: classify_ips_bulk() vs classify_ip()"
+echo "---------------------------------------------"
+python3 - <<'PYEOF'
+import ipaddress
+import random
+import sys
+from ip_locator import BULK_CLASSIFY_THRESHOLD, classify_ip, classify_ips_bulk
+
+try:
+    import numpy
+except ImportError:
+    print("SKIP: numpy is not installed")
+    sys.exit(0)
+
+rng = random.Random(1)
+ips = [str(ipaddress.IPv4Address(rng.getrandbits(32))) for _ in range(BULK_CLASSIFY_THRESHOLD)]
+ips += [f"192.0.0.{i}" for i in range(256)]
+ips += ["127.0.0.1", "169.254.1.1", "10.0.0.1", "::1", "fc00::1", "8.8.8.8\x00", "not an ip"]
+
+kinds = classify_ips_bulk(ips)
+expected = [classify_ip(ip)[1] for ip in ips]
+if type(kinds) is not list or kinds != expected:
+    mismatches = [ip for ip, kind, want in zip(ips, kinds, expected) if kind != want]
+    print(f"FAIL: {type(kinds).__name__} result, {len(mismatches)} mismatches, e.g. {mismatches[:5]!r}")
+    sys.exit(1)
+print(f"PASS: {len(ips)} addresses classified identically")
+PYEOF
+echo ""
+
+# Test 13: IP list from stdin
+echo "Test 13: Locate IPs read from stdin"
+echo "-----------------------------------"
+printf "10.0.0.1\n\n127.0.0.1\n" | python3 ip_locator.py -i - --no-color
+echo ""
+
 echo "=== All tests completed ==="
 echo ""
 echo "If all tests passed successfully, the tool is ready to use!"